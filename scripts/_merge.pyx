@@ -0,0 +1,118 @@
+# cython: language_level=3
+"""
+Compiled version of parse_conferences._merge_rows
+
+Build in place with: cythonize -i scripts/_merge.pyx
+parse_conferences.py falls back to the pure Python version when this is not built.
+"""
+from cpython.unicode cimport Py_UNICODE_ISDECIMAL, Py_UNICODE_ISSPACE
+
+
+cdef str _strip_theme_prefix(str theme):
+    """Remove a numeric prefix (e.g., "10. ") from a theme"""
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t n = len(theme)
+    while i < n and Py_UNICODE_ISDECIMAL(theme[i]):
+        i += 1
+    if i == 0 or i == n or theme[i] != u'.':
+        return theme
+
+    i += 1
+    while i < n and Py_UNICODE_ISSPACE(theme[i]):
+        i += 1
+    return theme[i:]
+
+
+def merge_rows(tuple columns, Py_ssize_t width, rows):
+    """
+    Group CSV rows by normalized full name.
+    Returns (conferences_map, themes_seen, themes) for the given rows.
+    """
+    cdef Py_ssize_t i_name = columns[0]
+    cdef Py_ssize_t i_short = columns[1]
+    cdef Py_ssize_t i_theme = columns[2]
+    cdef Py_ssize_t i_rank = columns[3]
+    cdef Py_ssize_t i_cat = columns[4]
+
+    # Fields are kept in parallel lists indexed through key_to_idx and only
+    # turned into per-conference dicts once all rows are merged
+    cdef dict key_to_idx = {}
+    cdef list names = []
+    cdef list short_names = []
+    cdef list themes_lists = []
+    cdef list ranks = []
+    cdef list categories = []
+    cdef list themes_sets = []
+    cdef dict themes = {}
+
+    # Normalized theme for each raw theme string; the same themes repeat across rows
+    cdef dict theme_cache = {}
+
+    cdef list conf
+    cdef str full_name, full_name_key, short_name, theme, raw_theme, existing_short
+    cdef object found, cached
+    cdef Py_ssize_t idx
+    cdef set existing_themes
+
+    for conf in rows:
+        # Pad short rows so missing trailing fields read as empty strings
+        if len(conf) < width:
+            conf = conf + [""] * (width - len(conf))
+
+        full_name = conf[i_name].strip()
+        if not full_name:
+            # Rows without a full name cannot be grouped; skip them
+            continue
+        full_name_key = full_name.lower()
+        short_name = conf[i_short].strip()
+
+        raw_theme = conf[i_theme]
+        cached = theme_cache.get(raw_theme)
+        if cached is None:
+            theme = raw_theme
+            if theme and Py_UNICODE_ISDECIMAL(theme[0]):
+                theme = _strip_theme_prefix(theme)
+            theme = theme.strip()
+            theme_cache[raw_theme] = theme
+        else:
+            theme = cached
+
+        found = key_to_idx.get(full_name_key)
+        if found is None:
+            key_to_idx[full_name_key] = len(names)
+            names.append(full_name)
+            short_names.append(short_name)
+            themes_lists.append([theme] if theme else [])
+            ranks.append(conf[i_rank])
+            categories.append(conf[i_cat])
+            themes_sets.append({theme} if theme else set())
+        else:
+            idx = found
+            existing_themes = themes_sets[idx]
+            if theme and theme not in existing_themes:
+                existing_themes.add(theme)
+                (<list>themes_lists[idx]).append(theme)
+
+            existing_short = short_names[idx]
+            if short_name and (not existing_short or len(short_name) < len(existing_short)):
+                short_names[idx] = short_name
+
+        if theme:
+            themes[theme] = None
+
+    cdef dict conferences_map = {}
+    cdef dict themes_seen = {}
+    for full_name_key, found in key_to_idx.items():
+        idx = found
+        conferences_map[full_name_key] = {
+            "name": names[idx],
+            "short_name": short_names[idx],
+            "themes": themes_lists[idx],
+            "rank": ranks[idx],
+            "category": categories[idx],
+            "information": {},
+            "url": "",
+        }
+        themes_seen[full_name_key] = themes_sets[idx]
+
+    return conferences_map, themes_seen, themes
@@ -2,130 +2,413 @@
 """
 Parse conferences CSV and analyze structure
 """
+import argparse
+import codecs
 import csv
 import json
-import sys
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-def read_csv_with_encoding(file_path: str, encoding: str = 'utf-8') -> List[Dict]:
-    """Read CSV file with specified encoding"""
-    conferences = []
+# orjson is optional; it serializes much faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled _merge_rows is optional; build it with: cythonize -i scripts/_merge.pyx
+try:
+    from _merge import merge_rows as _merge_rows_compiled
+except ImportError:
+    _merge_rows_compiled = None
+
+logger = logging.getLogger(__name__)
+
+# Number of leading bytes used to detect the CSV encoding
+_ENCODING_PROBE_SIZE = 65536
+
+# Buffer size for reading the CSV and writing the JSON output
+_IO_BUFFER_SIZE = 1 << 20
+
+# Files at least this large are parsed with pyarrow when it is installed
+_FAST_CSV_MIN_SIZE = 1 << 20
+
+# Inputs with at least this many rows are merged in worker processes,
+# in chunks of _PARALLEL_CHUNK_SIZE rows
+_PARALLEL_MIN_ROWS = 100000
+_PARALLEL_CHUNK_SIZE = 25000
+
+# Chunks queued per worker process; bounds how many rows are held in memory at once
+_PARALLEL_CHUNKS_PER_WORKER = 2
+
+# Columns read from the CSV: full name, short name, theme, rank, category
+_REQUIRED_COLUMNS = ("正式名称", "略称", "注力テーマ", "ランク", "分野小分類")
+
+def _strip_theme_prefix(theme: str) -> str:
+    """Remove a numeric prefix (e.g., "10. ") from a theme without using the regex engine"""
+    i = 0
+    n = len(theme)
+    while i < n and theme[i].isdecimal():
+        i += 1
+    if i == 0 or i == n or theme[i] != '.':
+        return theme
+
+    i += 1
+    while i < n and theme[i].isspace():
+        i += 1
+    return theme[i:]
+
+def _decodes_as(probe: bytes, encoding: str) -> bool:
+    """Check whether the leading bytes of a file decode with the given encoding"""
+    # Use an incremental decoder so a multi-byte character cut off at the
+    # end of the probe is not mistaken for a decode error
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(probe, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+class _FastCSVError(Exception):
+    """pyarrow could not parse a CSV that the csv module may still read"""
+
+def _iter_csv_fast(file_path: str, encoding: str) -> Optional[Iterator[List[str]]]:
+    """Stream CSV rows (header first) with pyarrow, or return None if pyarrow is unavailable"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+
+    # Take the header from the csv module so column names match the fallback path,
+    # and keep every column as a string
+    with open(file_path, 'r', encoding=encoding, newline='') as f:
+        header = next(csv.reader(f), [])
+    if not header:
+        return None
+
+    try:
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(encoding=encoding, column_names=header, skip_rows=1),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in header}),
+        )
+    except pa.ArrowException:
+        return None
+
+    def rows():
+        yield header
+        # Convert one record batch at a time so only a batch is held in memory
+        try:
+            for batch in reader:
+                columns = [column.to_pylist() for column in batch.columns]
+                for row in zip(*columns):
+                    yield list(row)
+        except pa.ArrowException as e:
+            # Parse errors in later blocks only show up while iterating
+            raise _FastCSVError(str(e)) from e
+
+    return rows()
+
+def _iter_csv_rows(file_path: str, encoding: str, use_fast: bool) -> Iterator[List[str]]:
+    """Stream CSV rows (header first) decoded with the given encoding"""
+    if use_fast:
+        rows = _iter_csv_fast(file_path, encoding)
+        if rows is not None:
+            yield from rows
+            return
+
+    with open(file_path, 'r', encoding=encoding, newline='', buffering=_IO_BUFFER_SIZE) as f:
+        yield from csv.reader(f)
+
+def _process_csv(file_path: str, encoding: str, use_fast: bool,
+                 process: Callable[[List[str], Iterator[List[str]]], Any]) -> Tuple[List[str], Any]:
+    """Stream the CSV rows to process(header, rows), returning the header and its result"""
+    rows = _iter_csv_rows(file_path, encoding, use_fast)
+    header = next(rows, [])
+    return header, process(header, rows)
+
+def read_csv_with_encoding(file_path: str, encoding: str = 'utf-8-sig',
+                           process: Optional[Callable[[List[str], Iterator[List[str]]], Any]] = None) -> Any:
+    """
+    Read CSV file with specified encoding.
+    Rows are streamed to process(header, rows) and its result is returned;
+    without process, the header and a list of the data rows are returned.
+    Only decoding errors move on to the next encoding; errors raised by process propagate.
+    """
+    if process is None:
+        process = lambda header, rows: (header, list(rows))
 
     # Try different encodings
-    encodings = [encoding, 'utf-8', 'shift_jis', 'cp932', 'iso-2022-jp']
+    # utf-8-sig also reads plain UTF-8 but drops a BOM that would otherwise end up
+    # in the first column name; cp932 is a superset of shift_jis, so try it first
+    encodings = list(dict.fromkeys([encoding, 'utf-8-sig', 'utf-8', 'cp932', 'shift_jis', 'iso-2022-jp']))
+
+    # Detect the encoding on a small probe so the whole file is decoded only once
+    with open(file_path, 'rb') as f:
+        probe = f.read(_ENCODING_PROBE_SIZE)
+
+    use_fast = os.path.getsize(file_path) >= _FAST_CSV_MIN_SIZE
 
     for enc in encodings:
+        if not _decodes_as(probe, enc):
+            continue
         try:
-            with open(file_path, 'r', encoding=enc) as f:
-                reader = csv.DictReader(f)
-                conferences = list(reader)
-                print(f"Successfully read with encoding: {enc}")
-                print(f"Total conferences: {len(conferences)}")
-                print(f"Columns: {conferences[0].keys() if conferences else 'None'}")
-                return conferences
+            try:
+                header, result = _process_csv(file_path, enc, use_fast, process)
+            except _FastCSVError as e:
+                # Start over with the csv module, which also reads rows pyarrow rejects
+                logger.warning("pyarrow could not parse the CSV (%s); retrying with the csv module", e)
+                header, result = _process_csv(file_path, enc, False, process)
         except UnicodeDecodeError:
+            # The probe decoded but a later part of the file did not
             continue
-        except Exception as e:
-            print(f"Error with {enc}: {e}")
-            continue
+
+        logger.info("Successfully read with encoding: %s", enc)
+        logger.info("Columns: %s", header if header else 'None')
+        return result
 
     raise ValueError("Could not read CSV with any encoding")
 
-def analyze_csv_structure(file_path: str):
-    """Analyze CSV structure and print sample data"""
-    conferences = read_csv_with_encoding(file_path)
+def analyze_csv_structure(file_path: str, verbose: bool = False) -> Tuple[List[str], List[List[str]]]:
+    """Analyze CSV structure and log sample data in verbose mode"""
+    header, conferences = read_csv_with_encoding(file_path)
+    logger.info("Total conferences: %d", len(conferences))
 
-    if conferences:
-        print("\n=== Sample Conference Data ===")
+    if verbose and conferences:
+        logger.info("=== Sample Conference Data ===")
         for i, conf in enumerate(conferences[:5]):
-            print(f"\n--- Conference {i+1} ---")
-            for key, value in conf.items():
-                print(f"{key}: {value}")
+            logger.info("--- Conference %d ---", i + 1)
+            for key, value in zip(header, conf):
+                logger.info("%s: %s", key, value)
 
-    return conferences
+    return header, conferences
 
-def create_conference_json(conferences: List[Dict]) -> Dict:
-    """Convert conferences to structured JSON format"""
-    import re
+def write_json(output_path: Path, data: Dict):
+    """Write data as indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
 
-    structured_data = {
-        "conferences": [],
-        "themes": set(),
-        "last_updated": None
-    }
+    with open(output_path, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def _merge_rows(columns: Tuple[int, ...], width: int, rows: Iterable[List[str]]) -> Tuple[Dict, Dict, Dict]:
+    """
+    Group CSV rows by normalized full name.
+    Returns (conferences_map, themes_seen, themes) for the given rows.
+    """
+    i_name, i_short, i_theme, i_rank, i_cat = columns
 
     # Group conferences by normalized full name to merge duplicates
-    # This handles cases where same conference has different short names
-    conferences_map = {}
+    # This handles cases where same conference has different short names.
+    # Fields are kept in parallel lists indexed through key_to_idx and only
+    # turned into per-conference dicts once all rows are merged.
+    key_to_idx = {}
+    names = []
+    short_names = []
+    themes_lists = []
+    ranks = []
+    categories = []
+
+    # Themes already attached to each conference, for O(1) duplicate checks
+    themes_sets = []
+
+    # All themes, used as an ordered set (values are unused)
+    themes = {}
+
+    # Normalized theme for each raw theme string; the same themes repeat across rows
+    theme_cache = {}
+
+    for conf in rows:
+        # Pad short rows so missing trailing fields read as empty strings
+        if len(conf) < width:
+            conf = conf + [""] * (width - len(conf))
 
-    for conf in conferences:
         # Normalize full name for matching (strip whitespace, lowercase)
-        full_name = conf.get("正式名称", "").strip()
-        full_name_key = full_name.lower().strip()
+        full_name = conf[i_name].strip()
+        if not full_name:
+            # Rows without a full name cannot be grouped; skip them
+            continue
+        full_name_key = full_name.lower()
+        short_name = conf[i_short].strip()
 
         # Remove numeric prefix from theme (e.g., "10. " -> "")
-        theme = conf.get("注力テーマ", "")
-        theme = re.sub(r'^\d+\.\s*', '', theme).strip()
+        # Only themes starting with a digit can carry the prefix, so skip the scan otherwise
+        raw_theme = conf[i_theme]
+        theme = theme_cache.get(raw_theme)
+        if theme is None:
+            theme = raw_theme
+            if theme and theme[0].isdecimal():
+                theme = _strip_theme_prefix(theme)
+            theme = theme.strip()
+            theme_cache[raw_theme] = theme
 
-        # If this conference doesn't exist yet, create it
-        if full_name_key not in conferences_map:
-            conf_data = {
-                "name": full_name,
-                "short_name": conf.get("略称", "").strip(),
-                "themes": [theme] if theme else [],  # Changed to array
-                "rank": conf.get("ランク", ""),
-                "category": conf.get("分野小分類", ""),
-                "information": {},  # Year-based information
-                "url": "",  # To be filled by scraping
-            }
-            conferences_map[full_name_key] = conf_data
+        idx = key_to_idx.get(full_name_key)
+        if idx is None:
+            # If this conference doesn't exist yet, create it
+            key_to_idx[full_name_key] = len(names)
+            names.append(full_name)
+            short_names.append(short_name)
+            themes_lists.append([theme] if theme else [])
+            ranks.append(conf[i_rank])
+            categories.append(conf[i_cat])
+            themes_sets.append({theme} if theme else set())
         else:
             # Conference already exists, add theme if not already present
-            existing_conf = conferences_map[full_name_key]
-            if theme and theme not in existing_conf["themes"]:
-                existing_conf["themes"].append(theme)
+            existing_themes = themes_sets[idx]
+            if theme and theme not in existing_themes:
+                existing_themes.add(theme)
+                themes_lists[idx].append(theme)
 
             # Prefer shorter abbreviation if multiple exist
-            existing_short = existing_conf["short_name"]
-            new_short = conf.get("略称", "").strip()
-            if new_short and (not existing_short or len(new_short) < len(existing_short)):
-                existing_conf["short_name"] = new_short
+            existing_short = short_names[idx]
+            if short_name and (not existing_short or len(short_name) < len(existing_short)):
+                short_names[idx] = short_name
 
         # Add theme to global themes set
         if theme:
-            structured_data["themes"].add(theme)
+            themes[theme] = None
+
+    conferences_map = {}
+    themes_seen = {}
+    for full_name_key, idx in key_to_idx.items():
+        conferences_map[full_name_key] = {
+            "name": names[idx],
+            "short_name": short_names[idx],
+            "themes": themes_lists[idx],  # Changed to array
+            "rank": ranks[idx],
+            "category": categories[idx],
+            "information": {},  # Year-based information
+            "url": "",  # To be filled by scraping
+        }
+        themes_seen[full_name_key] = themes_sets[idx]
+
+    return conferences_map, themes_seen, themes
+
+def _merge_partial(conferences_map: Dict, themes_seen: Dict, themes: Dict, partial: Tuple[Dict, Dict, Dict]):
+    """Fold a _merge_rows result for later rows into the accumulated result, in place"""
+    partial_map, partial_seen, partial_themes = partial
+
+    for full_name_key, conf_data in partial_map.items():
+        if full_name_key not in conferences_map:
+            conferences_map[full_name_key] = conf_data
+            themes_seen[full_name_key] = partial_seen[full_name_key]
+            continue
+
+        # Same rules as for duplicate rows: append unseen themes, prefer the shorter abbreviation
+        existing_conf = conferences_map[full_name_key]
+        existing_themes = themes_seen[full_name_key]
+        for theme in conf_data["themes"]:
+            if theme not in existing_themes:
+                existing_themes.add(theme)
+                existing_conf["themes"].append(theme)
+
+        short_name = conf_data["short_name"]
+        existing_short = existing_conf["short_name"]
+        if short_name and (not existing_short or len(short_name) < len(existing_short)):
+            existing_conf["short_name"] = short_name
+
+    themes.update(partial_themes)
+
+def _merge_rows_parallel(columns: Tuple[int, ...], width: int, rows: Iterator[List[str]]) -> Iterator[Tuple[Dict, Dict, Dict]]:
+    """
+    Run _merge_rows over fixed-size chunks of rows in worker processes, yielding results in row order.
+    Only a few chunks per worker are queued at a time, so rows are read as the workers catch up.
+    """
+    merge = _merge_rows_compiled or _merge_rows
+    workers = os.cpu_count() or 1
+    max_pending = workers * _PARALLEL_CHUNKS_PER_WORKER
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            for chunk in iter(lambda: list(islice(rows, _PARALLEL_CHUNK_SIZE)), []):
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(merge, columns, width, chunk))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+def create_conference_json(header: List[str], conferences: Iterable[List[str]]) -> Dict:
+    """Convert conferences to structured JSON format"""
+    structured_data = {
+        "conferences": [],
+        "themes": [],
+        "last_updated": None
+    }
+
+    # An empty file has no header and no rows
+    if not header:
+        return structured_data
+
+    missing = [column for column in _REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"CSV is missing required columns: {missing}")
+
+    # Resolve column positions once instead of building a dict per row
+    columns = tuple(header.index(column) for column in _REQUIRED_COLUMNS)
+    width = len(header)
+
+    # Only large inputs are worth the cost of starting worker processes
+    rows = iter(conferences)
+    head = list(islice(rows, _PARALLEL_MIN_ROWS))
+    if len(head) < _PARALLEL_MIN_ROWS or (os.cpu_count() or 1) < 2:
+        partials = [(_merge_rows_compiled or _merge_rows)(columns, width, chain(head, rows))]
+    else:
+        partials = _merge_rows_parallel(columns, width, chain(head, rows))
+
+    conferences_map, themes_seen, themes = {}, {}, {}
+    for partial in partials:
+        _merge_partial(conferences_map, themes_seen, themes, partial)
 
     # Convert map to list
     structured_data["conferences"] = list(conferences_map.values())
 
-    # Convert set to list for JSON serialization
-    structured_data["themes"] = sorted(list(structured_data["themes"]))
+    # Convert set to sorted list for JSON serialization
+    structured_data["themes"] = sorted(themes)
 
     return structured_data
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse conferences CSV into conferences_base.json")
+    parser.add_argument("csv_path", nargs="?", help="Path to the conferences CSV (default: public/data/conferences.csv)")
+    parser.add_argument("--verbose", action="store_true", help="Log encoding detection and sample rows")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+
     # Use relative path to CSV file in project directory
     # Or use command line argument for custom CSV path
-    if len(sys.argv) > 1:
-        csv_path = Path(sys.argv[1])
-        print(f"Using custom CSV path: {csv_path}")
+    if args.csv_path:
+        csv_path = Path(args.csv_path)
+        logger.info("Using custom CSV path: %s", csv_path)
     else:
         csv_path = Path(__file__).parent.parent / "public" / "data" / "conferences.csv"
-        print(f"Using default CSV path: {csv_path}")
+        logger.info("Using default CSV path: %s", csv_path)
 
-    # Analyze structure
-    conferences = analyze_csv_structure(csv_path)
+    if args.verbose:
+        # Analyze structure (keeps all rows in memory to show samples)
+        header, conferences = analyze_csv_structure(csv_path, verbose=True)
 
-    # Create structured JSON
-    structured_data = create_conference_json(conferences)
+        # Create structured JSON
+        structured_data = create_conference_json(header, conferences)
+    else:
+        # Create structured JSON straight from the row stream
+        structured_data = read_csv_with_encoding(csv_path, process=create_conference_json)
 
     # Save to file (in public/data for web access)
     output_path = Path(__file__).parent.parent / "public" / "data" / "conferences_base.json"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(structured_data, f, ensure_ascii=False, indent=2)
+    write_json(output_path, structured_data)
 
     print(f"\n✓ Saved base conference data to {output_path}")
     print(f"✓ Total conferences: {len(structured_data['conferences'])}")
@@ -2,40 +2,321 @@
 """
 Scrape CFP (Call for Papers) information from various sources
 """
+import argparse
+import copy
+import functools
+import io
 import json
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
 from pathlib import Path
 import time
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, UnicodeDammit
 except ImportError:
     print("Installing required packages...")
     import subprocess
-    subprocess.run(["pip3", "install", "requests", "beautifulsoup4"], check=True)
+    subprocess.run(["pip3", "install", "requests", "beautifulsoup4", "lxml"], check=True)
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, UnicodeDammit
+
+# Parse with libxml2 through lxml when available; it is much faster than html.parser
+try:
+    from lxml import etree
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    etree = None
+    _HTML_PARSER = 'html.parser'
+
+# selectolax is optional; its Lexbor parser reads event pages much faster than BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# orjson is optional; it parses and serializes much faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# requests-cache is optional; when installed, WikiCFP responses are cached on disk
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+
+# WikiCFP request limits: at most this many requests in flight,
+# and request starts spaced at least this many seconds apart (default for --request-interval).
+# WikiCFP is a third-party site, so keep the spacing conservative.
+_MAX_CONCURRENT_REQUESTS = 8
+_MIN_REQUEST_INTERVAL = 1.5
+
+# On-disk cache for WikiCFP responses (used when requests-cache is installed)
+_HTTP_CACHE_PATH = Path(__file__).parent.parent / ".wikicfp_cache"
+_HTTP_CACHE_EXPIRE_AFTER = timedelta(hours=12)
+
+# ETag / Last-Modified and parsed details of event pages, for conditional requests
+# on the next run (only used without requests-cache, which revalidates on its own)
+_PAGE_CACHE_PATH = Path(__file__).parent.parent / ".wikicfp_pages.json"
+# Pages not requested for this long are dropped from the page cache
+_PAGE_CACHE_MAX_AGE = timedelta(days=90)
+
+# Search results from earlier runs, reused while younger than the max age
+_RESULT_CACHE_PATH = Path(__file__).parent.parent / ".cfp_year_cache.json"
+_RESULT_CACHE_MAX_AGE = timedelta(days=3)
+
+# Conferences with actual data for every target year are not scraped again for this long
+_SCRAPED_DATA_MAX_AGE = timedelta(days=7)
+
+# Number of conferences searched concurrently
+_MAX_CONCURRENT_SEARCHES = 4
+
+# Number of event links taken from a search results page
+_MAX_EVENT_LINKS = 30
+
+# Precompiled patterns used on every event page and date string
+_WS_RE = re.compile(r'\s+')
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_DATE_TOKENS_RE = re.compile(r'\w+ \d+(?:, \d{4})?')
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+# Dates accepted by parse_date: "January 15, 2024" / "Jan 15, 2024", "2024-01-15",
+# and "15 January 2024" / "15 Jan 2024" (month names are case-insensitive)
+_DATE_RE = re.compile(
+    r'(?P<mname1>[A-Za-z]+) (?P<d1>\d{1,2}), (?P<y1>\d{4})'
+    r'|(?P<y2>\d{4})-(?P<m2>\d{1,2})-(?P<d2>\d{1,2})'
+    r'|(?P<d3>\d{1,2}) (?P<mname3>[A-Za-z]+) (?P<y3>\d{4})'
+)
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7,
+    'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# Deadline row labels: any of these keywords marks a deadline
+_DEADLINE_KEYWORDS_RE = re.compile(r'deadline|due|submission|notification|registration|camera|final')
+
+# Deadline type by label, in priority order. Each branch only uses lookaheads and
+# the match is anchored at the start, so the first branch that applies wins
+# (like an if/elif chain of substring tests) and lastgroup names the type.
+_DEADLINE_TYPE_RE = re.compile(
+    r'(?=.*abstract)(?=.*registration)(?P<abstract_registration>)'
+    r'|(?=.*submission (?:deadline|due))(?P<submission>)'
+    r'|(?=.*notification)(?P<notification>)'
+    r'|(?=.*(?:final version|camera ready))(?P<camera_ready>)'
+    r'|(?=.*workshop)(?P<workshop>)'
+    r'|(?=.*poster)(?P<poster>)'
+    r'|(?=.*demo)(?P<demo>)',
+    re.DOTALL,
+)
+
+
+def read_json(path: Path):
+    """Read a UTF-8 JSON file, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path: Path, data, indent: bool = False):
+    """Write data as UTF-8 JSON (indented by 2 spaces if requested), using orjson when available"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None))
+        return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2 if indent else None)
+
+
+def _parse_iso_date(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string as stored by parse_date"""
+    return date.fromisoformat(date_str)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_name_pattern(conference_name_normalized: str) -> Pattern:
+    """Compile the word-boundary pattern used to match a normalized conference name"""
+    # Use word boundary regex for more accurate matching
+    # For short conference names (<=3 chars), be more strict to avoid false matches
+    # e.g., "CC" should not match "AI-CC", but should match "CC 2026" or ": CC"
+    if len(conference_name_normalized) <= 3:
+        # For short names, require space, colon, or start/end of string before/after
+        pattern = r'(?:^|[\s:])' + re.escape(conference_name_normalized) + r'(?:[\s:]|$)'
+    else:
+        # For longer names, regular word boundary is fine
+        pattern = r'\b' + re.escape(conference_name_normalized) + r'\b'
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_exclusion_pattern(pattern: str) -> Pattern:
+    """Compile a case-insensitive exclusion pattern"""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _find_event_links(content: bytes, limit: int) -> List[tuple]:
+    """
+    Return (href, link text) for the first `limit` event links on a search results page.
+    With lxml the page is streamed and parsing stops once enough links are found.
+    """
+    if etree is None:
+        soup = BeautifulSoup(content, _HTML_PARSER)
+        return [
+            (link['href'], link.get_text(strip=True))
+            for link in soup.select('a[href*="eventid"][href*="showcfp"]', limit=limit)
+        ]
+
+    links = []
+    if limit <= 0:
+        return links
+    for _, element in etree.iterparse(io.BytesIO(content), events=('end',), tag='a', html=True):
+        href = element.get('href')
+        if href and 'eventid' in href and 'showcfp' in href:
+            # Same text as BeautifulSoup's get_text(strip=True)
+            links.append((href, ''.join(text.strip() for text in element.itertext())))
+            if len(links) >= limit:
+                break
+        element.clear(keep_tail=True)
+    return links
+
+
+def _declared_charset(response) -> Optional[str]:
+    """Charset from the response's Content-Type header, if the server sent one"""
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+
+def _parse_event_page(content: bytes, charset: Optional[str] = None) -> Tuple[str, str, List[Tuple[str, str]]]:
+    """
+    Return the <title> text, the first h1-h3 heading, and (label, value) for every
+    table row that has a <th> and a <td> among its own cells.
+    Rows of nested tables are visited once each and only pair cells of that row.
+    The bytes are decoded with charset when given, else with the charset the page declares.
+    """
+    if LexborHTMLParser is None:
+        soup = BeautifulSoup(content, _HTML_PARSER, from_encoding=charset)
+        title_tag = soup.find('title')
+        heading_tag = soup.select_one('h1, h2, h3')
+        rows = []
+        for row in soup.find_all('tr'):
+            th = row.find('th', recursive=False)
+            td = row.find('td', recursive=False)
+            if th and td:
+                rows.append((th.get_text(strip=True), td.get_text(strip=True)))
+        return (
+            title_tag.get_text(strip=True) if title_tag else '',
+            heading_tag.get_text(strip=True) if heading_tag else '',
+            rows,
+        )
+
+    # Lexbor would read the bytes as UTF-8; decode them the way BeautifulSoup does so
+    # both parsers see the same text
+    markup = UnicodeDammit(content, [charset] if charset else [], is_html=True).unicode_markup
+    tree = LexborHTMLParser(markup)
+    title_node = tree.css_first('title')
+    heading_node = tree.css_first('h1, h2, h3')
+    rows = []
+    for row in tree.css('tr'):
+        th = td = None
+        for cell in row.iter():
+            if cell.tag == 'th' and th is None:
+                th = cell
+            elif cell.tag == 'td' and td is None:
+                td = cell
+        if th is not None and td is not None:
+            rows.append((th.text(strip=True), td.text(strip=True)))
+    return (
+        title_node.text(strip=True) if title_node is not None else '',
+        heading_node.text(strip=True) if heading_node is not None else '',
+        rows,
+    )
 
 
 class CFPScraper:
     """Scraper for conference CFP information"""
 
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, clear_cache: bool = False, request_interval: float = _MIN_REQUEST_INTERVAL):
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                str(_HTTP_CACHE_PATH),
+                backend='sqlite',
+                expire_after=_HTTP_CACHE_EXPIRE_AFTER,
+                allowable_codes=(200,),
+            )
+            if clear_cache:
+                self.session.cache.clear()
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
 
+        # Shared by the worker threads that fetch event pages
+        self._request_slots = threading.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        self._rate_lock = threading.Lock()
+        self._request_interval = request_interval
+        self._last_request_time = 0.0
+
+        # Parsed event pages by URL; similar conference names share search results
+        self._details_cache = {}
+
+        # Event page validators from earlier runs, and those seen in this run
+        self._use_page_cache = requests_cache is None
+        self._previous_pages = {}
+        if self._use_page_cache and not clear_cache:
+            try:
+                pages = read_json(_PAGE_CACHE_PATH)
+            except (OSError, ValueError):
+                pages = {}
+            now = time.time()
+            max_age = _PAGE_CACHE_MAX_AGE.total_seconds()
+            self._previous_pages = {
+                url: page for url, page in pages.items()
+                if now - page.get('checked', now) < max_age
+            }
+        self._pages = {}
+
+    def _get(self, url: str, **kwargs):
+        """GET a WikiCFP page, bounding concurrency and spacing out network requests to be nice to the server"""
+        if requests_cache is not None:
+            # Fresh cached responses skip the limiter; only_if_cached answers 504 for
+            # anything that would need a request (only 200 responses are cached)
+            response = self.session.get(url, only_if_cached=True, **kwargs)
+            if response.status_code == 200:
+                return response
+
+        with self._request_slots:
+            with self._rate_lock:
+                wait = self._last_request_time + self._request_interval - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                self._last_request_time = time.monotonic()
+            return self.session.get(url, **kwargs)
+
+    def save_page_cache(self):
+        """
+        Save the event page validators, including those of pages not requested in this run
+        (e.g. when the search results came from the result cache)
+        """
+        if self._use_page_cache:
+            write_json(_PAGE_CACHE_PATH, {**self._previous_pages, **self._pages})
+
     def get_exclusion_patterns(self, conference_name: str) -> list:
         """
         Get exclusion patterns for a given conference name to avoid false matches.
         This helps distinguish similar conference names.
         """
-        import re
-
         # Common patterns to exclude for specific conferences
         exclusion_map = {
             'cluster': [r'ccgrid', r'grid'],  # CLUSTER should not match CCGRID
@@ -58,69 +339,61 @@ class CFPScraper:
             search_query = conference_name.replace('ACM ', '')
             params = {'q': search_query, 'year': 'a'}  # 'a' for all years
 
-            response = self.session.get(search_url, params=params, timeout=10)
+            response = self._get(search_url, params=params, timeout=10)
             if response.status_code != 200:
                 return {}
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-
             # Find conference entries by looking for eventid links
             # Collect all potential event links first (don't filter by name yet)
-            event_links = []
-
-            for link in soup.find_all('a', href=True):
-                if 'eventid' in link['href'] and 'showcfp' in link['href']:
-                    event_links.append(link)
+            # Check more events to find all years
+            event_links = _find_event_links(response.content, _MAX_EVENT_LINKS)
 
             if not event_links:
                 return {}
 
             # Collect data for each target year
             year_data = {}
-            today = datetime.now().date()
+            # Deadlines are stored as YYYY-MM-DD, which compares correctly as a string
+            today_iso = datetime.now().strftime('%Y-%m-%d')
+
+            # Normalize for matching: remove spaces from conference name but not from texts
+            # This allows "WWW" to match "The Web 2026 : WWW 2026" in the event title
+            conference_name_normalized = conference_name.lower().replace('acm ', '').replace('ieee ', '').strip()
+
+            # Check if conference name appears as a standalone word (word boundary check)
+            # This prevents "WWW" from matching "CIAWI" or other conferences
+            pattern_re = _compile_name_pattern(conference_name_normalized)
+
+            # Additional check: Reject matches if they contain exclusion patterns
+            # This helps distinguish similar conference names
+            exclusion_res = [
+                _compile_exclusion_pattern(excl_pattern)
+                for excl_pattern in self.get_exclusion_patterns(conference_name_normalized)
+            ]
 
-            for event_link in event_links[:30]:  # Check more events to find all years
-                event_url = f"http://www.wikicfp.com{event_link['href']}"
-                details = self.get_wikicfp_details(event_url)
+            # Fetch event pages concurrently; matching below stays sequential and in search order
+            event_urls = [f"http://www.wikicfp.com{href}" for href, _ in event_links]
+            all_details = self.iter_wikicfp_details(event_urls)
 
+            for (_, event_link_text), details in zip(event_links, all_details):
                 if not details:
                     continue
 
                 # Check if this event matches our conference
                 # Match by link text, event title, or "When" field
-                link_text = event_link.get_text(strip=True).lower()
+                link_text = event_link_text.lower()
                 event_title = details.get('event_title', '').lower()
                 when_text = details.get('when_text', '').lower()
                 page_title = details.get('page_title', '').lower()
 
-                # Normalize for matching: remove spaces from conference name but not from texts
-                # This allows "WWW" to match "The Web 2026 : WWW 2026" in the event title
-                conference_name_normalized = conference_name.lower().replace('acm ', '').replace('ieee ', '').strip()
-
-                # Check if conference name appears as a standalone word (word boundary check)
-                # This prevents "WWW" from matching "CIAWI" or other conferences
-                import re
-                # Use word boundary regex for more accurate matching
-                # For short conference names (<=3 chars), be more strict to avoid false matches
-                # e.g., "CC" should not match "AI-CC", but should match "CC 2026" or ": CC"
-                if len(conference_name_normalized) <= 3:
-                    # For short names, require space, colon, or start/end of string before/after
-                    pattern = r'(?:^|[\s:])' + re.escape(conference_name_normalized) + r'(?:[\s:]|$)'
-                else:
-                    # For longer names, regular word boundary is fine
-                    pattern = r'\b' + re.escape(conference_name_normalized) + r'\b'
-
-                link_match = re.search(pattern, link_text) is not None
-                title_match = re.search(pattern, event_title) is not None
-                when_match = re.search(pattern, when_text) is not None
-                page_title_match = re.search(pattern, page_title) is not None
+                link_match = pattern_re.search(link_text) is not None
+                title_match = pattern_re.search(event_title) is not None
+                when_match = pattern_re.search(when_text) is not None
+                page_title_match = pattern_re.search(page_title) is not None
 
-                # Additional check: Reject matches if they contain exclusion patterns
-                # This helps distinguish similar conference names
-                exclusion_patterns = self.get_exclusion_patterns(conference_name_normalized)
                 has_exclusion = any(
-                    re.search(excl_pattern, text, re.IGNORECASE)
-                    for excl_pattern in exclusion_patterns
+                    excl_re.search(text)
+                    for excl_re in exclusion_res
                     for text in [link_text, event_title, page_title]
                 )
 
@@ -142,9 +415,8 @@ class CFPScraper:
                 # 1. Try to extract year from page title
                 # Format: "ACL 2025 : ..." or "WWW 2026 : ..."
                 if details.get('page_title'):
-                    import re
                     # Look for 4-digit year (20XX) near the beginning of title
-                    year_match = re.search(r'\b(20\d{2})\b', details['page_title'][:50])
+                    year_match = _YEAR_RE.search(details['page_title'][:50])
                     if year_match:
                         try:
                             event_year = int(year_match.group(1))
@@ -154,7 +426,7 @@ class CFPScraper:
                 # 2. If no year from title, try conference dates
                 if not event_year and details.get('conference_dates', {}).get('start'):
                     try:
-                        conf_date = datetime.strptime(details['conference_dates']['start'], '%Y-%m-%d')
+                        conf_date = _parse_iso_date(details['conference_dates']['start'])
                         event_year = conf_date.year
                     except:
                         pass
@@ -164,7 +436,7 @@ class CFPScraper:
                     for dl in details['deadlines']:
                         if dl.get('date'):
                             try:
-                                dl_date = datetime.strptime(dl['date'], '%Y-%m-%d')
+                                dl_date = _parse_iso_date(dl['date'])
                                 # Assume deadline is for next year's conference
                                 # This is a fallback and may not always be correct
                                 event_year = dl_date.year + 1
@@ -175,60 +447,53 @@ class CFPScraper:
                 # Store if this is a target year and we don't have better data yet
                 if event_year in target_years:
                     # Calculate match quality (prefer exact matches in link text)
+                    composite_title = '/' in event_title  # Titles like "WWW/Internet"
                     new_match_quality = 0
                     if link_match:
                         new_match_quality = 3  # Highest priority: match in link text
-                    elif title_match and not '/' in event_title:  # Avoid titles like "WWW/Internet"
+                    elif title_match and not composite_title:
                         new_match_quality = 2
                     elif title_match:
                         new_match_quality = 1  # Lowest: match in composite title
 
-                    if event_year not in year_data:
+                    # Keep the comparison inputs with the details, so later candidates for
+                    # the same year compare against them without re-matching or re-parsing
+                    details['_link_text'] = link_text
+                    details['_scraped_on'] = today_iso
+                    details['_match_quality'] = new_match_quality
+                    details['_has_future'] = any(
+                        dl.get('date', '') > today_iso
+                        for dl in details.get('deadlines', [])
+                    )
+
+                    existing = year_data.get(event_year)
+                    if existing is None:
+                        year_data[event_year] = details
+                    # Replace if new match is better quality
+                    elif new_match_quality > existing['_match_quality']:
                         year_data[event_year] = details
-                    else:
-                        # Calculate existing match quality
-                        existing_link_text = year_data[event_year].get('_link_text', '')
-                        existing_title = year_data[event_year].get('event_title', '').lower()
-                        existing_match_quality = 0
-                        if re.search(pattern, existing_link_text) is not None:
-                            existing_match_quality = 3
-                        elif re.search(pattern, existing_title) is not None and not '/' in existing_title:
-                            existing_match_quality = 2
-                        elif re.search(pattern, existing_title) is not None:
-                            existing_match_quality = 1
-
-                        # Replace if new match is better quality
-                        if new_match_quality > existing_match_quality:
+                    # If same quality, check future deadlines
+                    elif new_match_quality == existing['_match_quality']:
+                        new_has_future = details['_has_future']
+                        existing_has_future = existing['_has_future']
+
+                        # Replace if new data has future deadlines and existing doesn't
+                        if new_has_future and not existing_has_future:
                             year_data[event_year] = details
-                            year_data[event_year]['_link_text'] = link_text
-                        # If same quality, check future deadlines
-                        elif new_match_quality == existing_match_quality:
-                            existing_has_future = any(
-                                datetime.strptime(dl['date'], '%Y-%m-%d').date() > today
-                                for dl in year_data[event_year].get('deadlines', [])
-                                if dl.get('date')
-                            )
-                            new_has_future = any(
-                                datetime.strptime(dl['date'], '%Y-%m-%d').date() > today
-                                for dl in details.get('deadlines', [])
-                                if dl.get('date')
-                            )
-
-                            # Replace if new data has future deadlines and existing doesn't
-                            if new_has_future and not existing_has_future:
+                        # Or if both have future deadlines but new one has more complete data
+                        elif new_has_future and existing_has_future:
+                            if len(details.get('deadlines', [])) > len(existing.get('deadlines', [])):
                                 year_data[event_year] = details
-                                year_data[event_year]['_link_text'] = link_text
-                            # Or if both have future deadlines but new one has more complete data
-                            elif new_has_future and existing_has_future:
-                                if len(details.get('deadlines', [])) > len(year_data[event_year].get('deadlines', [])):
-                                    year_data[event_year] = details
-                                    year_data[event_year]['_link_text'] = link_text
-
-                    # Store link text for comparison
-                    if event_year in year_data and '_link_text' not in year_data[event_year]:
-                        year_data[event_year]['_link_text'] = link_text
 
-                # Don't stop early - check all events to find all target years
+                    # Stop once every target year has a link text match with future deadlines;
+                    # later events could only win on the number of deadlines
+                    if all(
+                        year in year_data
+                        and year_data[year]['_match_quality'] == 3
+                        and year_data[year]['_has_future']
+                        for year in target_years
+                    ):
+                        break
 
             return year_data
 
@@ -236,14 +501,41 @@ class CFPScraper:
             print(f"Error searching WikiCFP for {conference_name}: {e}")
             return {}
 
+    def iter_wikicfp_details(self, urls: List[str]) -> Iterator[Optional[Dict]]:
+        """
+        Yield get_wikicfp_details for each URL in order. Pages are fetched concurrently a
+        batch at a time, so pages after the point where the caller stops are never requested.
+        """
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+            for start in range(0, len(urls), _MAX_CONCURRENT_REQUESTS):
+                yield from executor.map(self.get_wikicfp_details, urls[start:start + _MAX_CONCURRENT_REQUESTS])
+
     def get_wikicfp_details(self, url: str) -> Optional[Dict]:
         """Get detailed information from a WikiCFP event page"""
+        # Callers add keys (e.g. '_link_text') to the result, so hand out copies
+        cached = self._details_cache.get(url)
+        if cached is not None:
+            return copy.copy(cached)
+
         try:
-            response = self.session.get(url, timeout=10)
+            # Ask the server to skip the body if the page is unchanged since the last run
+            headers = {}
+            previous = self._previous_pages.get(url)
+            if previous is not None:
+                if previous.get('etag'):
+                    headers['If-None-Match'] = previous['etag']
+                if previous.get('last_modified'):
+                    headers['If-Modified-Since'] = previous['last_modified']
+
+            response = self._get(url, headers=headers, timeout=10)
+            if response.status_code == 304 and previous is not None:
+                self._pages[url] = dict(previous, checked=time.time())
+                self._details_cache[url] = previous['details']
+                return copy.copy(previous['details'])
             if response.status_code != 200:
                 return None
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page_title, event_title, rows = _parse_event_page(response.content, _declared_charset(response))
 
             details = {
                 'source': 'wikicfp',
@@ -255,75 +547,63 @@ class CFPScraper:
                 'page_title': ''  # Store the page <title> tag for year extraction
             }
 
-            # Extract page title (from <title> tag) for accurate year detection
+            # Page title (from <title> tag) for accurate year detection
             # Title format: "ACL 2025 : The 63rd Annual Meeting..."
-            page_title_tag = soup.find('title')
-            if page_title_tag:
-                details['page_title'] = page_title_tag.get_text(strip=True)
+            details['page_title'] = page_title
 
-            # Extract event title (contains conference name and year)
+            # Event title (contains conference name and year)
             # Title format: "The Web 2026 : WWW 2026 : The Web Conference"
-            title_tags = soup.find_all(['h1', 'h2', 'h3'])
-            if title_tags:
-                details['event_title'] = title_tags[0].get_text(strip=True)
+            details['event_title'] = event_title
+
+            # (type, date) of the deadlines added so far; pages may list the same deadline twice
+            seen_deadlines = set()
 
             # Extract important dates from all tables
-            # WikiCFP uses <th> for labels and <td> for values
-            tables = soup.find_all('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    # Look for rows with <th> (label) and <td> (value)
-                    th = row.find('th')
-                    td = row.find('td')
-
-                    if th and td:
-                        label = th.get_text(strip=True)
-                        value = td.get_text(strip=True)
-
-                        label_lower = label.lower()
-
-                        # Parse different types of deadlines
-                        # Check for any deadline-related keywords
-                        deadline_keywords = ['deadline', 'due', 'submission', 'notification', 'registration', 'camera', 'final']
-                        if any(keyword in label_lower for keyword in deadline_keywords):
-                            date = self.parse_date(value)
-                            if date:
-                                # Determine deadline type and label
-                                deadline_type = None
-                                deadline_label = label  # Use original label text
-
-                                if 'abstract' in label_lower and 'registration' in label_lower:
-                                    deadline_type = 'abstract_registration'
-                                elif 'submission deadline' in label_lower or 'submission due' in label_lower:
-                                    deadline_type = 'submission'
-                                elif 'notification' in label_lower:
-                                    deadline_type = 'notification'
-                                elif 'final version' in label_lower or 'camera ready' in label_lower:
-                                    deadline_type = 'camera_ready'
-                                elif 'workshop' in label_lower:
-                                    deadline_type = 'workshop'
-                                elif 'poster' in label_lower:
-                                    deadline_type = 'poster'
-                                elif 'demo' in label_lower:
-                                    deadline_type = 'demo'
-                                else:
-                                    # Generic deadline type based on label
-                                    deadline_type = 'other'
-
-                                details['deadlines'].append({
-                                    'type': deadline_type,
-                                    'date': date,
-                                    'label': deadline_label
-                                })
-                        elif label_lower == 'when':
-                            # Store the "When" field text for conference name matching
-                            details['when_text'] = value
-                            dates = self.parse_date_range(value)
-                            if dates:
-                                details['conference_dates'] = dates
-
-            return details
+            # WikiCFP uses <th> for labels and <td> for values.
+            for label, value in rows:
+                label_lower = label.lower()
+
+                # Parse different types of deadlines
+                # Check for any deadline-related keywords
+                if _DEADLINE_KEYWORDS_RE.search(label_lower):
+                    deadline_date = self.parse_date(value)
+                    if deadline_date:
+                        # Determine deadline type and label
+                        # Generic deadline type when no specific type matches
+                        type_match = _DEADLINE_TYPE_RE.match(label_lower)
+                        deadline_type = type_match.lastgroup if type_match else 'other'
+                        deadline_label = label  # Use original label text
+
+                        key = (deadline_type, deadline_date)
+                        if key in seen_deadlines:
+                            continue
+                        seen_deadlines.add(key)
+
+                        details['deadlines'].append({
+                            'type': deadline_type,
+                            'date': deadline_date,
+                            'label': deadline_label
+                        })
+                elif label_lower == 'when':
+                    # Store the "When" field text for conference name matching
+                    details['when_text'] = value
+                    dates = self.parse_date_range(value)
+                    if dates:
+                        details['conference_dates'] = dates
+
+            self._details_cache[url] = details
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if self._use_page_cache and (etag or last_modified):
+                self._pages[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'details': details,
+                    'checked': time.time(),
+                }
+
+            return copy.copy(details)
 
         except Exception as e:
             print(f"Error getting WikiCFP details from {url}: {e}")
@@ -334,26 +614,28 @@ class CFPScraper:
         if not date_str or date_str.lower() in ['tbd', 'n/a', 'none']:
             return None
 
-        # Common date formats
-        date_formats = [
-            '%B %d, %Y',  # January 15, 2024
-            '%b %d, %Y',  # Jan 15, 2024
-            '%Y-%m-%d',   # 2024-01-15
-            '%d %B %Y',   # 15 January 2024
-            '%d %b %Y',   # 15 Jan 2024
-        ]
-
         # Clean the date string
-        date_str = re.sub(r'\s+', ' ', date_str).strip()
+        date_str = _WS_RE.sub(' ', date_str).strip()
 
-        for fmt in date_formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
+        # Match all common formats at once instead of trying strptime per format
+        match = _DATE_RE.fullmatch(date_str)
+        if not match:
+            return None
 
-        return None
+        if match.group('y1'):
+            year, month, day = match.group('y1'), _MONTHS.get(match.group('mname1').lower()), match.group('d1')
+        elif match.group('y2'):
+            year, month, day = match.group('y2'), match.group('m2'), match.group('d2')
+        else:
+            year, month, day = match.group('y3'), _MONTHS.get(match.group('mname3').lower()), match.group('d3')
+
+        if month is None:
+            return None
+
+        try:
+            return date(int(year), int(month), int(day)).isoformat()
+        except ValueError:
+            return None
 
     def parse_date_range(self, date_str: str) -> Optional[Dict]:
         """Parse date range string"""
@@ -361,7 +643,7 @@ class CFPScraper:
             return None
 
         # Try to find date patterns
-        dates = re.findall(r'\w+ \d+(?:, \d{4})?', date_str)
+        dates = _DATE_TOKENS_RE.findall(date_str)
         if len(dates) >= 2:
             start_date = self.parse_date(dates[0])
             end_date = self.parse_date(dates[-1])
@@ -373,19 +655,6 @@ class CFPScraper:
 
         return None
 
-    def deduplicate_deadlines(self, deadlines: List[Dict]) -> List[Dict]:
-        """Remove duplicate deadlines based on type and date"""
-        seen = set()
-        unique_deadlines = []
-
-        for deadline in deadlines:
-            key = (deadline.get('type'), deadline.get('date'))
-            if key not in seen:
-                seen.add(key)
-                unique_deadlines.append(deadline)
-
-        return unique_deadlines
-
     def predict_next_year_dates(self, previous_dates: Dict) -> Dict:
         """Predict next year's dates based on previous year"""
         predicted = {
@@ -398,7 +667,7 @@ class CFPScraper:
         for deadline in previous_dates.get('deadlines', []):
             if deadline.get('date'):
                 try:
-                    prev_date = datetime.strptime(deadline['date'], '%Y-%m-%d')
+                    prev_date = _parse_iso_date(deadline['date'])
                     # Add one year
                     next_date = prev_date.replace(year=prev_date.year + 1)
 
@@ -416,12 +685,12 @@ class CFPScraper:
             conf_dates = previous_dates['conference_dates']
             if conf_dates.get('start'):
                 try:
-                    prev_start = datetime.strptime(conf_dates['start'], '%Y-%m-%d')
+                    prev_start = _parse_iso_date(conf_dates['start'])
                     next_start = prev_start.replace(year=prev_start.year + 1)
                     predicted['conference_dates']['start'] = next_start.strftime('%Y-%m-%d')
 
                     if conf_dates.get('end'):
-                        prev_end = datetime.strptime(conf_dates['end'], '%Y-%m-%d')
+                        prev_end = _parse_iso_date(conf_dates['end'])
                         next_end = prev_end.replace(year=prev_end.year + 1)
                         predicted['conference_dates']['end'] = next_end.strftime('%Y-%m-%d')
                 except Exception:
@@ -430,9 +699,118 @@ class CFPScraper:
         return predicted
 
 
-def update_conferences_with_cfp(conferences_data: Dict) -> Dict:
-    """Update conference data with CFP information"""
-    scraper = CFPScraper()
+def _result_cache_key(conference_name: str, target_years: list) -> str:
+    """Key of a conference's search results in the result cache"""
+    return f"{conference_name}|{','.join(str(year) for year in target_years)}"
+
+
+def load_result_cache() -> Dict:
+    """Load search results saved by earlier runs, dropping entries older than the max age"""
+    try:
+        cache = read_json(_RESULT_CACHE_PATH)
+    except (OSError, ValueError):
+        return {}
+
+    now = time.time()
+    max_age = _RESULT_CACHE_MAX_AGE.total_seconds()
+    return {
+        key: entry for key, entry in cache.items()
+        if now - entry.get('timestamp', 0) < max_age
+    }
+
+
+def save_result_cache(cache: Dict):
+    """Save search results for the next run"""
+    write_json(_RESULT_CACHE_PATH, cache)
+
+
+def search_conferences(scraper: CFPScraper, conferences: List[Dict], target_years: list,
+                       result_cache: Optional[Dict] = None) -> Iterator[Dict[int, Dict]]:
+    """
+    Search WikiCFP for several conferences at once, yielding results in input order.
+    CFPScraper keeps the total request rate bounded across the concurrent searches.
+    Conferences found in result_cache are not searched again; new results are added to it.
+    Only _MAX_CONCURRENT_SEARCHES searches run ahead of the consumer, and searches not yet
+    started are cancelled if it stops early.
+    """
+    if result_cache is None:
+        result_cache = {}
+
+    def result_of(key: str, search) -> Dict[int, Dict]:
+        if search is None:
+            return {int(year): details for year, details in result_cache[key]['years'].items()}
+
+        year_data_map = search.result()
+        # Empty results are not cached, as they may come from a failed request
+        if year_data_map:
+            result_cache[key] = {
+                'timestamp': time.time(),
+                'years': {str(year): details for year, details in year_data_map.items()},
+            }
+        return year_data_map
+
+    # (cache key, future or None for a cached result), in input order
+    pending = deque()
+    in_flight = 0
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_SEARCHES) as executor:
+        try:
+            for conf in conferences:
+                name = conf['short_name'] or conf['name']
+                key = _result_cache_key(name, target_years)
+                if key in result_cache:
+                    pending.append((key, None))
+                else:
+                    pending.append((key, executor.submit(scraper.search_wikicfp_multi_year, name, target_years)))
+                    in_flight += 1
+
+                # Hand out results as soon as they are next in order, and wait for the
+                # oldest search while as many searches are submitted as the pool runs
+                while pending and (pending[0][1] is None or in_flight >= _MAX_CONCURRENT_SEARCHES):
+                    key, search = pending.popleft()
+                    if search is not None:
+                        in_flight -= 1
+                    yield result_of(key, search)
+
+            while pending:
+                key, search = pending.popleft()
+                yield result_of(key, search)
+        finally:
+            for _, search in pending:
+                if search is not None:
+                    search.cancel()
+
+
+def has_fresh_actual_data(conf: Dict, target_years: list, today: date) -> bool:
+    """
+    Whether a conference has actual (not predicted) data for every target year,
+    and the most recent year was scraped within _SCRAPED_DATA_MAX_AGE
+    """
+    information = conf.get('information', {})
+    for year in target_years:
+        year_info = information.get(str(year), {})
+        deadlines = year_info.get('deadlines', [])
+        if not (deadlines or year_info.get('conference_dates')):
+            return False
+        if year_info.get('is_predicted') or any(dl.get('is_predicted', False) for dl in deadlines):
+            return False
+
+    last_scraped = information[str(max(target_years))].get('last_scraped')
+    if not last_scraped:
+        return False
+    try:
+        return today - _parse_iso_date(last_scraped) < _SCRAPED_DATA_MAX_AGE
+    except ValueError:
+        return False
+
+
+def update_conferences_with_cfp(conferences_data: Dict, clear_cache: bool = False,
+                                request_interval: float = _MIN_REQUEST_INTERVAL,
+                                previous_data: Optional[Dict] = None) -> Dict:
+    """
+    Update conference data with CFP information.
+    Conferences that have fresh actual data in previous_data (the last output) take it from there.
+    """
+    scraper = CFPScraper(clear_cache=clear_cache, request_interval=request_interval)
 
     # Determine target years (current year, next year, next+1 year)
     current_year = datetime.now().year
@@ -441,13 +819,39 @@ def update_conferences_with_cfp(conferences_data: Dict) -> Dict:
     print(f"Scraping CFP information for {len(conferences_data['conferences'])} conferences...")
     print(f"Target years: {target_years}")
 
-    for i, conf in enumerate(conferences_data['conferences']):
+    # Results of recent runs are reused unless the caches are being cleared
+    result_cache = {} if clear_cache else load_result_cache()
+
+    # Conferences the previous output has recent actual data for (all target years) are
+    # not scraped again; they keep that data instead
+    today = datetime.now().date()
+    today_iso = today.strftime('%Y-%m-%d')
+    previous_by_name = {}
+    if previous_data and not clear_cache:
+        previous_by_name = {prev['name'].lower(): prev for prev in previous_data.get('conferences', [])}
+    fresh_previous = []
+    for conf in conferences_data['conferences']:
+        prev = previous_by_name.get(conf['name'].lower())
+        fresh_previous.append(prev if prev is not None and has_fresh_actual_data(prev, target_years, today) else None)
+
+    # Search WikiCFP for multiple years, several conferences at a time
+    conferences_to_search = [
+        conf for conf, prev in zip(conferences_data['conferences'], fresh_previous) if prev is None
+    ]
+    year_data_maps = search_conferences(scraper, conferences_to_search, target_years, result_cache)
+
+    for i, (conf, prev) in enumerate(zip(conferences_data['conferences'], fresh_previous)):
         name = conf['short_name'] or conf['name']
         print(f"[{i+1}/{len(conferences_data['conferences'])}] Searching for: {name}")
 
-        # Search WikiCFP for multiple years
-        year_data_map = scraper.search_wikicfp_multi_year(name, target_years)
+        if prev is not None:
+            print("  → Skipping (fresh data)")
+            conf['information'] = prev['information']
+            if prev.get('url'):
+                conf['url'] = prev['url']
+            continue
 
+        year_data_map = next(year_data_maps)
         if year_data_map:
             print(f"  → Found data for years: {list(year_data_map.keys())}")
 
@@ -458,7 +862,6 @@ def update_conferences_with_cfp(conferences_data: Dict) -> Dict:
                     break
 
             # Process each year's data
-            today = datetime.now().date()
             for year, cfp_data in year_data_map.items():
                 year_str = str(year)
 
@@ -473,8 +876,11 @@ def update_conferences_with_cfp(conferences_data: Dict) -> Dict:
                     print(f"  → Year {year}: Replacing predicted data with actual data")
 
                 conf['information'][year_str] = {
-                    'deadlines': scraper.deduplicate_deadlines(cfp_data.get('deadlines', [])),
-                    'conference_dates': cfp_data.get('conference_dates', {})
+                    # get_wikicfp_details already drops duplicate deadlines
+                    'deadlines': cfp_data.get('deadlines', []),
+                    'conference_dates': cfp_data.get('conference_dates', {}),
+                    # Results reused from the search result cache keep the day they were scraped
+                    'last_scraped': cfp_data.get('_scraped_on', today_iso)
                 }
 
             # For years without actual data, try to predict from previous year
@@ -532,8 +938,8 @@ def update_conferences_with_cfp(conferences_data: Dict) -> Dict:
                             elif prev_is_predicted:
                                 print(f"  → Year {year}: Skipping prediction (previous year is also predicted)")
 
-        # Be nice to the server
-        time.sleep(1)
+    save_result_cache(result_cache)
+    scraper.save_page_cache()
 
     conferences_data['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
@@ -541,20 +947,31 @@ def update_conferences_with_cfp(conferences_data: Dict) -> Dict:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update conference data with CFP information from WikiCFP")
+    parser.add_argument("--no-cache", action="store_true", help="Clear the cached WikiCFP responses and search results, and rescrape conferences with fresh data")
+    parser.add_argument("--request-interval", type=float, default=_MIN_REQUEST_INTERVAL,
+                        help=f"Minimum seconds between WikiCFP requests (default: {_MIN_REQUEST_INTERVAL})")
+    args = parser.parse_args()
+
     # Load base conference data (from public/data for web access)
     base_data_path = Path(__file__).parent.parent / "public" / "data" / "conferences_base.json"
 
-    with open(base_data_path, 'r', encoding='utf-8') as f:
-        conferences_data = json.load(f)
+    conferences_data = read_json(base_data_path)
 
-    # Update with CFP information
-    updated_data = update_conferences_with_cfp(conferences_data)
-
-    # Save updated data (in public/data for web access)
+    # Updated data is saved in public/data for web access; the previous output
+    # provides recently scraped data that does not need scraping again
     output_path = Path(__file__).parent.parent / "public" / "data" / "conferences_with_cfp.json"
+    try:
+        previous_data = read_json(output_path)
+    except (OSError, ValueError):
+        previous_data = None
+
+    # Update with CFP information
+    updated_data = update_conferences_with_cfp(conferences_data, clear_cache=args.no_cache,
+                                               request_interval=args.request_interval,
+                                               previous_data=previous_data)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(updated_data, f, ensure_ascii=False, indent=2)
+    write_json(output_path, updated_data, indent=True)
 
     print(f"\n✓ Saved updated conference data to {output_path}")
     print(f"✓ Last updated: {updated_data['last_updated']}")